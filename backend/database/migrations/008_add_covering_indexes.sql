@@ -0,0 +1,15 @@
+-- Composite and covering indexes for the hot JOIN queries
+-- Migration 008: Index story character lookups and ordered script line reads
+
+-- story_characters is only read by the external story service, which filters on
+-- story_project_id and orders by importance_level; with character_id last the
+-- index also covers the join column, so no filesort or row lookup is needed.
+-- The old (story_project_id, character_id) index duplicates unique_story_character.
+CREATE INDEX idx_sc_story_importance_char ON story_characters(story_project_id, importance_level DESC, character_id);
+DROP INDEX idx_story_character ON story_characters;
+
+-- Script line reads filter on script_id and order by line_order
+CREATE INDEX idx_script_lines_script_order ON script_lines(script_id, line_order);
+
+-- Success message
+SELECT 'Covering indexes created successfully!' as message;
@@ -43,6 +43,10 @@ $capsule->addConnection([
     'charset' => 'utf8mb4',
     'collation' => 'utf8mb4_unicode_ci',
     'prefix' => '',
+    'options' => [
+        PDO::ATTR_PERSISTENT => filter_var($_ENV['DB_PERSISTENT'] ?? false, FILTER_VALIDATE_BOOLEAN),
+        PDO::MYSQL_ATTR_COMPRESS => filter_var($_ENV['DB_COMPRESS'] ?? false, FILTER_VALIDATE_BOOLEAN),
+    ],
 ]);
 
 $capsule->setAsGlobal();
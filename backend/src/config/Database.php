@@ -22,6 +22,8 @@ class Database {
                 PDO::ATTR_ERRMODE => PDO::ERRMODE_EXCEPTION,
                 PDO::ATTR_DEFAULT_FETCH_MODE => PDO::FETCH_ASSOC,
                 PDO::ATTR_EMULATE_PREPARES => false,
+                PDO::ATTR_PERSISTENT => filter_var($_ENV['DB_PERSISTENT'] ?? false, FILTER_VALIDATE_BOOLEAN),
+                PDO::MYSQL_ATTR_COMPRESS => filter_var($_ENV['DB_COMPRESS'] ?? false, FILTER_VALIDATE_BOOLEAN),
             ]);
         } catch (PDOException $e) {
             throw new PDOException("Database connection failed: " . $e->getMessage());
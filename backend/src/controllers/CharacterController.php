@@ -4,6 +4,15 @@ require_once __DIR__ . '/../config/Database.php';
 use VoiceGenerator\Config\Database;
 
 class CharacterController {
+    private const DEFAULT_EXPRESSIONS = [
+        'neutral' => 'neutral expression, calm face',
+        'happy' => 'happy expression, smiling',
+        'sad' => 'sad expression, downcast eyes',
+        'angry' => 'angry expression, furrowed brow',
+        'surprised' => 'surprised expression, wide eyes',
+        'confused' => 'confused expression, tilted head'
+    ];
+    
     private $db;
     
     public function __construct($database = null) {
@@ -23,14 +32,9 @@ class CharacterController {
                 return;
             }
             
-            // Check if character name already exists
-            $checkStmt = $this->db->prepare("SELECT id FROM character_profiles WHERE name = ?");
-            $checkStmt->execute([$input['name']]);
-            if ($checkStmt->fetch()) {
-                http_response_code(409);
-                echo json_encode(['error' => 'Character name already exists']);
-                return;
-            }
+            // Profile and default expressions are written in one transaction;
+            // duplicate names are rejected by the unique index on name
+            $this->db->beginTransaction();
             
             $stmt = $this->db->prepare("
                 INSERT INTO character_profiles (name, description, voice_profile_id, base_portrait_url) 
@@ -49,17 +53,33 @@ class CharacterController {
                 
                 // Create default expressions for the character
                 $this->createDefaultExpressions($characterId);
+                $this->db->commit();
                 
                 // Return the created character
                 $character = $this->getCharacterById($characterId);
                 http_response_code(201);
                 echo json_encode($character);
             } else {
+                $this->db->rollBack();
                 http_response_code(500);
                 echo json_encode(['error' => 'Failed to create character']);
             }
             
+        } catch (PDOException $e) {
+            if ($this->db->inTransaction()) {
+                $this->db->rollBack();
+            }
+            if (($e->errorInfo[1] ?? null) === 1062) {
+                http_response_code(409);
+                echo json_encode(['error' => 'Character name already exists']);
+                return;
+            }
+            http_response_code(500);
+            echo json_encode(['error' => 'Server error: ' . $e->getMessage()]);
         } catch (Exception $e) {
+            if ($this->db->inTransaction()) {
+                $this->db->rollBack();
+            }
             http_response_code(500);
             echo json_encode(['error' => 'Server error: ' . $e->getMessage()]);
         }
@@ -69,24 +89,24 @@ class CharacterController {
         header('Content-Type: application/json');
         
         try {
+            // Expression counts are aggregated in the same query to avoid N+1 lookups
             $stmt = $this->db->query("
-                SELECT cp.*, v.name as voice_name, v.parameters as voice_parameters
+                SELECT cp.*, v.name as voice_name, v.parameters as voice_parameters,
+                    COALESCE(ec.expression_count, 0) as expression_count
                 FROM character_profiles cp 
                 LEFT JOIN voices v ON cp.voice_profile_id = v.id
+                LEFT JOIN (
+                    SELECT character_id, COUNT(*) as expression_count
+                    FROM character_expressions
+                    GROUP BY character_id
+                ) ec ON ec.character_id = cp.id
                 ORDER BY cp.name
             ");
             
             $characters = $stmt->fetchAll(PDO::FETCH_ASSOC);
             
-            // Add expression counts
             foreach ($characters as &$character) {
-                $exprStmt = $this->db->prepare("
-                    SELECT COUNT(*) as expression_count 
-                    FROM character_expressions 
-                    WHERE character_id = ?
-                ");
-                $exprStmt->execute([$character['id']]);
-                $character['expression_count'] = (int)$exprStmt->fetchColumn();
+                $character['expression_count'] = (int)$character['expression_count'];
             }
             
             echo json_encode($characters);
@@ -123,7 +143,8 @@ class CharacterController {
             $input = json_decode(file_get_contents('php://input'), true);
             
             // Check if character exists
-            if (!$this->getCharacterById($id)) {
+            $existing = $this->getCharacterById($id);
+            if (!$existing) {
                 http_response_code(404);
                 echo json_encode(['error' => 'Character not found']);
                 return;
@@ -136,6 +157,28 @@ class CharacterController {
                 return;
             }
             
+            $fields = [
+                'name' => $input['name'],
+                'description' => $input['description'] ?? '',
+                'voice_profile_id' => !empty($input['voice_profile_id']) ? $input['voice_profile_id'] : null,
+                'base_portrait_url' => $input['base_portrait_url'] ?? null
+            ];
+            
+            // Skip the write entirely when nothing would change
+            $changed = false;
+            foreach ($fields as $column => $value) {
+                $current = $existing[$column];
+                if (($current === null || $value === null) ? $current !== $value : (string)$current !== (string)$value) {
+                    $changed = true;
+                    break;
+                }
+            }
+            
+            if (!$changed) {
+                echo json_encode($existing);
+                return;
+            }
+            
             // Check if new name conflicts with existing character (excluding current)
             $checkStmt = $this->db->prepare("SELECT id FROM character_profiles WHERE name = ? AND id != ?");
             $checkStmt->execute([$input['name'], $id]);
@@ -152,10 +195,10 @@ class CharacterController {
             ");
             
             $success = $stmt->execute([
-                $input['name'],
-                $input['description'] ?? '',
-                !empty($input['voice_profile_id']) ? $input['voice_profile_id'] : null,
-                $input['base_portrait_url'] ?? null,
+                $fields['name'],
+                $fields['description'],
+                $fields['voice_profile_id'],
+                $fields['base_portrait_url'],
                 $id
             ]);
             
@@ -178,7 +221,8 @@ class CharacterController {
         
         try {
             // Check if character exists
-            if (!$this->getCharacterById($id)) {
+            $character = $this->getCharacterById($id);
+            if (!$character) {
                 http_response_code(404);
                 echo json_encode(['error' => 'Character not found']);
                 return;
@@ -188,9 +232,9 @@ class CharacterController {
             $usageStmt = $this->db->prepare("
                 SELECT COUNT(*) as usage_count 
                 FROM script_lines 
-                WHERE character_name = (SELECT name FROM character_profiles WHERE id = ?)
+                WHERE character_name = ?
             ");
-            $usageStmt->execute([$id]);
+            $usageStmt->execute([$character['name']]);
             $usageCount = (int)$usageStmt->fetchColumn();
             
             if ($usageCount > 0) {
@@ -312,22 +356,18 @@ class CharacterController {
     }
     
     private function createDefaultExpressions($characterId) {
-        $defaultExpressions = [
-            'neutral' => 'neutral expression, calm face',
-            'happy' => 'happy expression, smiling',
-            'sad' => 'sad expression, downcast eyes',
-            'angry' => 'angry expression, furrowed brow',
-            'surprised' => 'surprised expression, wide eyes',
-            'confused' => 'confused expression, tilted head'
-        ];
+        // Insert every default expression in a single multi-row statement
+        $placeholders = [];
+        $values = [];
+        foreach (self::DEFAULT_EXPRESSIONS as $emotion => $prompt) {
+            $placeholders[] = '(?, ?, ?)';
+            array_push($values, $characterId, $emotion, $prompt);
+        }
         
         $stmt = $this->db->prepare("
             INSERT INTO character_expressions (character_id, emotion, expression_prompt)
-            VALUES (?, ?, ?)
-        ");
-        
-        foreach ($defaultExpressions as $emotion => $prompt) {
-            $stmt->execute([$characterId, $emotion, $prompt]);
-        }
+            VALUES " . implode(', ', $placeholders)
+        );
+        $stmt->execute($values);
     }
 }
\ No newline at end of file
@@ -8,6 +8,27 @@ use VoiceGenerator\Config\Database;
  * This file adds video-specific methods to work with the existing ScriptController
  */
 class ScriptControllerExtensions {
+    private const SCENE_UPDATE_BATCH_SIZE = 500;
+    
+    // Keyword => index into BACKGROUND_PROMPTS; lower index takes priority
+    private const BACKGROUND_KEYWORDS = [
+        'forest' => 0, 'tree' => 0,
+        'city' => 1, 'street' => 1,
+        'home' => 2, 'house' => 2, 'room' => 2,
+        'school' => 3, 'classroom' => 3,
+        'night' => 4, 'dark' => 4,
+        'beach' => 5, 'ocean' => 5
+    ];
+    
+    private const BACKGROUND_PROMPTS = [
+        "anime style forest background, lush green trees, natural lighting",
+        "anime style city background, urban environment, detailed buildings",
+        "anime style interior background, cozy room, warm lighting",
+        "anime style school background, classroom setting, bright lighting",
+        "anime style night background, starry sky, moonlight",
+        "anime style beach background, ocean waves, sunny day"
+    ];
+    
     private $db;
     
     public function __construct($database = null) {
@@ -98,14 +119,28 @@ class ScriptControllerExtensions {
             }
             $script['characters'] = $characters;
             
-            // Add script statistics
+            // Add script statistics, gathered in a single pass over the lines
+            $totalLines = count($script['lines']);
+            $linesWithCharacters = 0;
+            $linesWithBackgrounds = 0;
+            $totalLength = 0;
+            foreach ($script['lines'] as $line) {
+                if (!empty($line['character_name'])) {
+                    $linesWithCharacters++;
+                }
+                if (!empty($line['background_prompt'])) {
+                    $linesWithBackgrounds++;
+                }
+                $totalLength += strlen($line['content']);
+            }
+            
             $script['stats'] = [
-                'total_lines' => count($script['lines']),
+                'total_lines' => $totalLines,
                 'total_scenes' => count($script['scenes']),
                 'total_characters' => count($script['characters']),
-                'lines_with_characters' => count(array_filter($script['lines'], fn($line) => !empty($line['character_name']))),
-                'lines_with_backgrounds' => count(array_filter($script['lines'], fn($line) => !empty($line['background_prompt']))),
-                'avg_line_length' => count($script['lines']) > 0 ? array_sum(array_map(fn($line) => strlen($line['content']), $script['lines'])) / count($script['lines']) : 0
+                'lines_with_characters' => $linesWithCharacters,
+                'lines_with_backgrounds' => $linesWithBackgrounds,
+                'avg_line_length' => $totalLines > 0 ? $totalLength / $totalLines : 0
             ];
             
             echo json_encode($script);
@@ -249,7 +284,7 @@ class ScriptControllerExtensions {
             }
             
             $this->db->beginTransaction();
-            $updatedLines = [];
+            $lineIds = [];
             
             foreach ($input['updates'] as $update) {
                 if (!isset($update['line_id'])) {
@@ -261,8 +296,13 @@ class ScriptControllerExtensions {
                 
                 // Use existing updateScriptLine logic for each line
                 $this->updateSingleLine($lineId, $update);
-                
-                // Get updated line info
+                $lineIds[] = $lineId;
+            }
+            
+            // Fetch all updated lines in a single round-trip
+            $updatedLines = [];
+            if (!empty($lineIds)) {
+                $placeholders = implode(', ', array_fill(0, count(array_unique($lineIds)), '?'));
                 $stmt = $this->db->prepare("
                     SELECT 
                         sl.*,
@@ -273,13 +313,20 @@ class ScriptControllerExtensions {
                     FROM script_lines sl
                     LEFT JOIN character_profiles cp ON sl.character_name = cp.name
                     LEFT JOIN voices v ON cp.voice_profile_id = v.id
-                    WHERE sl.id = ?
+                    WHERE sl.id IN ({$placeholders})
                 ");
-                $stmt->execute([$lineId]);
-                $updatedLine = $stmt->fetch(PDO::FETCH_ASSOC);
+                $stmt->execute(array_values(array_unique($lineIds)));
+                
+                $linesById = [];
+                foreach ($stmt->fetchAll(PDO::FETCH_ASSOC) as $row) {
+                    $linesById[$row['id']] = $row;
+                }
                 
-                if ($updatedLine) {
-                    $updatedLines[] = $updatedLine;
+                // Keep the response in request order
+                foreach ($lineIds as $lineId) {
+                    if (isset($linesById[$lineId])) {
+                        $updatedLines[] = $linesById[$lineId];
+                    }
                 }
             }
             
@@ -408,6 +455,7 @@ class ScriptControllerExtensions {
             $currentScene = 1;
             $linesPerScene = max(1, ceil(count($lines) / 5)); // Aim for ~5 scenes
             
+            $sceneData = [];
             foreach ($lines as $index => $line) {
                 $sceneNumber = ceil(($index + 1) / $linesPerScene);
                 $sceneId = "scene_" . $sceneNumber;
@@ -415,14 +463,35 @@ class ScriptControllerExtensions {
                 // Generate basic background prompt based on content
                 $backgroundPrompt = $this->generateBackgroundPrompt($line['content'], $sceneId);
                 
+                $sceneData[] = [$line['id'], $sceneId, $backgroundPrompt];
+            }
+            
+            // Write scene data with multi-row UPDATEs instead of one statement per line
+            foreach (array_chunk($sceneData, self::SCENE_UPDATE_BATCH_SIZE) as $batch) {
+                $sceneCases = [];
+                $promptCases = [];
+                $sceneValues = [];
+                $promptValues = [];
+                $ids = [];
+                
+                foreach ($batch as [$lineId, $sceneId, $backgroundPrompt]) {
+                    $sceneCases[] = 'WHEN ? THEN ?';
+                    $promptCases[] = 'WHEN ? THEN ?';
+                    array_push($sceneValues, $lineId, $sceneId);
+                    array_push($promptValues, $lineId, $backgroundPrompt);
+                    $ids[] = $lineId;
+                }
+                
                 $updateStmt = $this->db->prepare("
                     UPDATE script_lines 
-                    SET scene_id = ?, background_prompt = ? 
-                    WHERE id = ? AND (scene_id IS NULL OR scene_id = '')
+                    SET scene_id = CASE id " . implode(' ', $sceneCases) . " END,
+                        background_prompt = CASE id " . implode(' ', $promptCases) . " END
+                    WHERE id IN (" . implode(', ', array_fill(0, count($ids), '?')) . ")
+                    AND (scene_id IS NULL OR scene_id = '')
                 ");
                 
-                if ($updateStmt->execute([$sceneId, $backgroundPrompt, $line['id']])) {
-                    $updatedCount++;
+                if ($updateStmt->execute(array_merge($sceneValues, $promptValues, $ids))) {
+                    $updatedCount += count($batch);
                 }
             }
             
@@ -462,23 +531,20 @@ class ScriptControllerExtensions {
     }
     
     private function generateBackgroundPrompt($content, $sceneId) {
-        // Simple background prompt generation based on content analysis
-        $content = strtolower($content);
-        
-        if (strpos($content, 'forest') !== false || strpos($content, 'tree') !== false) {
-            return "anime style forest background, lush green trees, natural lighting";
-        } elseif (strpos($content, 'city') !== false || strpos($content, 'street') !== false) {
-            return "anime style city background, urban environment, detailed buildings";
-        } elseif (strpos($content, 'home') !== false || strpos($content, 'house') !== false || strpos($content, 'room') !== false) {
-            return "anime style interior background, cozy room, warm lighting";
-        } elseif (strpos($content, 'school') !== false || strpos($content, 'classroom') !== false) {
-            return "anime style school background, classroom setting, bright lighting";
-        } elseif (strpos($content, 'night') !== false || strpos($content, 'dark') !== false) {
-            return "anime style night background, starry sky, moonlight";
-        } elseif (strpos($content, 'beach') !== false || strpos($content, 'ocean') !== false) {
-            return "anime style beach background, ocean waves, sunny day";
-        } else {
-            return "anime style background, detailed environment, " . str_replace('_', ' ', $sceneId);
+        // Simple background prompt generation based on content analysis.
+        // A single regex pass collects every keyword; the lookahead keeps
+        // overlapping hits (e.g. "tree" inside "street") so the earliest
+        // category still wins, as with the original ordered checks.
+        if (preg_match_all(self::backgroundKeywordPattern(), strtolower($content), $matches)) {
+            $category = min(array_map(fn($keyword) => self::BACKGROUND_KEYWORDS[$keyword], $matches[1]));
+            return self::BACKGROUND_PROMPTS[$category];
         }
+        
+        return "anime style background, detailed environment, " . str_replace('_', ' ', $sceneId);
+    }
+    
+    private static function backgroundKeywordPattern(): string {
+        static $pattern = null;
+        return $pattern ??= '/(?=(' . implode('|', array_map('preg_quote', array_keys(self::BACKGROUND_KEYWORDS))) . '))/';
     }
 }
\ No newline at end of file
@@ -526,15 +526,17 @@ class VideoProjectController {
             $sceneGroups[$sceneId][] = $line;
         }
 
+        // Index scene info by scene_id (first row wins) for O(1) lookups
+        $scenesById = [];
+        foreach ($scenes as $s) {
+            if (!isset($scenesById[$s['scene_id']])) {
+                $scenesById[$s['scene_id']] = $s;
+            }
+        }
+
         foreach ($sceneGroups as $sceneId => $lines) {
             // Find scene info
-            $sceneInfo = null;
-            foreach ($scenes as $s) {
-                if ($s['scene_id'] === $sceneId) {
-                    $sceneInfo = $s;
-                    break;
-                }
-            }
+            $sceneInfo = $scenesById[$sceneId] ?? null;
 
             // Build dialogue
             $dialogue = [];
@@ -545,18 +547,18 @@ class VideoProjectController {
                 ];
             }
 
-            // Get characters present in scene
+            // Get characters present in scene, using keys as a set for O(1) membership
             $charactersPresent = [];
             foreach ($lines as $line) {
-                if (!empty($line['character_name']) && !in_array($line['character_name'], $charactersPresent)) {
-                    $charactersPresent[] = $line['character_name'];
+                if (!empty($line['character_name'])) {
+                    $charactersPresent[$line['character_name']] = true;
                 }
             }
 
             $scenesArray[] = [
                 'scene_number' => $sceneNumber++,
                 'background_description' => $sceneInfo['background_prompt'] ?? ($lines[0]['background_prompt'] ?? ''),
-                'characters_present' => $charactersPresent,
+                'characters_present' => array_map('strval', array_keys($charactersPresent)),
                 'dialogue' => $dialogue,
                 'duration' => count($dialogue) * 2.5
             ];
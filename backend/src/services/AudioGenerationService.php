@@ -8,6 +8,7 @@ use VoiceGenerator\Models\Voice;
 
 class AudioGenerationService {
     private $serviceBaseUrl;
+    private $curl = null;
 
     public function __construct() {
         $this->serviceBaseUrl = 'http://localhost:9966';
@@ -163,7 +164,14 @@ class AudioGenerationService {
     private function callService(string $endpoint, ?array $data = null, string $method = 'POST'): array {
         $url = $this->serviceBaseUrl . $endpoint;
         
-        $curl = curl_init();
+        // Reuse one handle so libcurl keeps the connection alive between
+        // calls (notably the status polling loop); reset clears old options
+        if ($this->curl === null) {
+            $this->curl = curl_init();
+        } else {
+            curl_reset($this->curl);
+        }
+        $curl = $this->curl;
         
         $curlOptions = [
             CURLOPT_URL => $url,
@@ -189,8 +197,6 @@ class AudioGenerationService {
         $httpCode = curl_getinfo($curl, CURLINFO_HTTP_CODE);
         $error = curl_error($curl);
         
-        curl_close($curl);
-        
         if ($error) {
             throw new \Exception("Service communication error: {$error}");
         }